@@ -1,14 +1,19 @@
+import ctypes
 import logging
+import os
 import select
 import socket
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, nullcontext
 from datetime import timedelta
-from functools import partial
-from inspect import signature
+from functools import cached_property
+from itertools import chain
 from math import atan2, tau
-from time import sleep
+from time import sleep, time
 
 import linuxfd
 import numpy as np
+import numpy.typing as npt
 from jeepney import DBusAddress, Properties
 from jeepney.io.blocking import open_dbus_connection
 from skyfield.api import Time, load
@@ -16,14 +21,150 @@ from skyfield.toposlib import GeographicPosition
 from skyfield.units import Angle, Velocity
 
 from .config import AzEl, Config
-from .radio import Radio
+from .radio import DEFAULT_MORSE_DELAY, Radio
 from .rotator import Rotator
 from .satellite import Satellite
-from .station import Station
+from .station import DEFAULT_LNA_DELAY, Station
 from .tracker import PassInfo, Tracker
 
 logger = logging.getLogger(__name__)
 
+# Proleptic Gregorian ordinal of the POSIX epoch, 1970-01-01
+_UNIX_ORDINAL = 719163
+
+# From sys/mman.h
+_MCL_CURRENT = 1
+_MCL_FUTURE = 2
+
+# From sys/timex.h
+_TIME_ERROR = 5
+_STA_UNSYNC = 0x0040
+
+# From asm-generic/socket.h, not exposed by the socket module
+_SO_BUSY_POLL = 46
+_SO_PREFER_BUSY_POLL = 69
+
+
+class _Timex(ctypes.Structure):
+    # struct timex from sys/timex.h, ctypes inserts the same padding as the C compiler
+    _fields_ = (
+        ('modes', ctypes.c_uint),
+        ('offset', ctypes.c_long),
+        ('freq', ctypes.c_long),
+        ('maxerror', ctypes.c_long),
+        ('esterror', ctypes.c_long),
+        ('status', ctypes.c_int),
+        ('constant', ctypes.c_long),
+        ('precision', ctypes.c_long),
+        ('tolerance', ctypes.c_long),
+        ('time_sec', ctypes.c_long),
+        ('time_usec', ctypes.c_long),
+        ('tick', ctypes.c_long),
+        ('ppsfreq', ctypes.c_long),
+        ('jitter', ctypes.c_long),
+        ('shift', ctypes.c_int),
+        ('stabil', ctypes.c_long),
+        ('jitcnt', ctypes.c_long),
+        ('calcnt', ctypes.c_long),
+        ('errcnt', ctypes.c_long),
+        ('stbcnt', ctypes.c_long),
+        ('tai', ctypes.c_int),
+        ('_reserved', ctypes.c_int * 11),
+    )
+
+
+def _adjtimex_synchronized() -> bool | None:
+    '''Ask the kernel directly whether the clock is synchronized.
+
+    Returns None if adjtimex(3) isn't available so the caller can fall back to asking timedated.
+    '''
+    try:
+        adjtimex = ctypes.CDLL(None, use_errno=True).adjtimex
+    except AttributeError:
+        return None
+    tx = _Timex()  # modes = 0, read only
+    ret = adjtimex(ctypes.byref(tx))
+    if ret < 0:
+        logger.debug("adjtimex failed: %s", os.strerror(ctypes.get_errno()))
+        return None
+    return bool(ret != _TIME_ERROR and not tx.status & _STA_UNSYNC)
+
+
+@contextmanager
+def _realtime(priority: int = 50) -> Iterator[None]:
+    '''Run the calling thread under SCHED_FIFO with its memory locked.
+
+    Needs CAP_SYS_NICE and CAP_IPC_LOCK, or equivalent rtprio/memlock limits. Without them this
+    logs a warning and carries on at normal priority rather than abandoning the pass.
+
+    Parameters
+    ----------
+    priority
+        SCHED_FIFO priority, 1-99
+    '''
+    policy = os.sched_getscheduler(0)
+    param = os.sched_getparam(0)
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+        permitted = True
+    except PermissionError:
+        permitted = False
+    # Yield outside the except so errors from the pass don't get PermissionError as context
+    if not permitted:
+        logger.warning("Not permitted to use realtime scheduling, continuing without")
+        yield
+        return
+
+    libc = ctypes.CDLL(None, use_errno=True)
+    locked = libc.mlockall(_MCL_CURRENT | _MCL_FUTURE) == 0
+    if not locked:
+        logger.warning("mlockall failed: %s", os.strerror(ctypes.get_errno()))
+    try:
+        yield
+    finally:
+        if locked:
+            libc.munlockall()
+        os.sched_setscheduler(0, policy, param)
+
+
+class Sleeper:
+    def __init__(self) -> None:
+        '''Wait like time.sleep() but can be interrupted.
+
+        Long waits (clock sync, hours until the next pass) can be cut short from another thread
+        or a signal handler with cancel() instead of having to kill the process.
+        '''
+        self._timer = linuxfd.timerfd(rtc=False, nonBlocking=True, closeOnExec=True)
+        self._cancel = linuxfd.eventfd(nonBlocking=True, closeOnExec=True)
+        self._epoll = select.epoll()
+        self._epoll.register(self._timer.fileno(), select.EPOLLIN)
+        self._epoll.register(self._cancel.fileno(), select.EPOLLIN)
+
+    def sleep(self, seconds: float) -> bool:
+        '''Sleep for the given number of seconds.
+
+        Returns True if the full time elapsed or False if woken early by cancel(). A cancel()
+        while not sleeping wakes the next sleep immediately.
+        '''
+        if seconds > 0:
+            self._timer.settime(seconds)
+        try:
+            events = self._epoll.poll(-1 if seconds > 0 else 0)
+        finally:
+            self._timer.settime(0)
+        if any(fd == self._cancel.fileno() for fd, _ in events):
+            self._cancel.read()
+            return False
+        return True
+
+    def cancel(self) -> None:
+        self._cancel.write(1)
+
+    def close(self) -> None:
+        self._epoll.close()
+        self._timer.close()
+        self._cancel.close()
+
 
 class SinglePass:
     def __init__(
@@ -36,21 +177,48 @@ class SinglePass:
         '''Assemble all things needed to run a single pass.'''
         # FIXME fetch these values from stationd/gnuradio
         if lna_delay is None:
-            lna_delay = signature(Station.__init__).parameters['lna_delay'].default
+            lna_delay = DEFAULT_LNA_DELAY
         if morse_delay is None:
-            morse_delay = signature(Radio.__init__).parameters['morse_delay'].default
+            morse_delay = DEFAULT_MORSE_DELAY
         if cooloff_delay is None:
             cooloff_delay = 120.0
         self.conf = conf
-        # TODO: check if resources are available but don't require until start of pass
-        self.sta = Station(conf.station, band='l-band')
-        self.uhf = Station(conf.station, band='uhf', lna_delay=lna_delay)
-        self.rot = Rotator(conf.rotator, cal=conf.cal)
-        self.rad = Radio(conf.flowgraph, conf.edl_dest, conf.name, morse_delay=morse_delay)
+        self.lna_delay = lna_delay
+        self.morse_delay = morse_delay
         self.ts = load.timescale()
 
         self.cooloff_delay = cooloff_delay
         self.min_el = 15  # FIXME: move to calc
+        # EDL packets are received into and forwarded straight from here, one at a time
+        self._edl_buf = memoryview(bytearray(4096))
+
+    # Hardware is only connected on first use and released after every pass, so startup doesn't
+    # require it and a stationd/flowgraph restart between passes gets picked up.
+    # TODO: check if resources are available but don't require until start of pass
+    @cached_property
+    def sta(self) -> Station:
+        return Station(self.conf.station, band='l-band')
+
+    @cached_property
+    def uhf(self) -> Station:
+        return Station(self.conf.station, band='uhf', lna_delay=self.lna_delay)
+
+    @cached_property
+    def rot(self) -> Rotator:
+        return Rotator(self.conf.rotator, cal=self.conf.cal)
+
+    @cached_property
+    def rad(self) -> Radio:
+        return Radio(
+            self.conf.flowgraph, self.conf.edl_dest, self.conf.name, morse_delay=self.morse_delay
+        )
+
+    def release_hardware(self) -> None:
+        '''Close any hardware connections, the next use reconnects.'''
+        for name in ('sta', 'uhf', 'rot', 'rad'):
+            dev = self.__dict__.pop(name, None)
+            if dev is not None:
+                dev.close()
 
     def work(
         self,
@@ -87,35 +255,38 @@ class SinglePass:
 
         # calculate events array for each task?
         self.epoll = select.epoll()
-        self.epoll.register(self.rot.listener, select.EPOLLIN)
-        aosfd = linuxfd.timerfd(rtc=True, nonBlocking=True)
-        losfd = linuxfd.timerfd(rtc=True, nonBlocking=True)
-        rotfd = linuxfd.timerfd(rtc=True, nonBlocking=True)
-        radfd = linuxfd.timerfd(rtc=True, nonBlocking=True)
-        posfd = linuxfd.timerfd(rtc=True, nonBlocking=True)
-        thmfd = linuxfd.timerfd(rtc=True, nonBlocking=True)
+        self._aos_timer = linuxfd.timerfd(rtc=True, nonBlocking=True)
+        self._los_timer = linuxfd.timerfd(rtc=True, nonBlocking=True)
+        self._nav_timer = linuxfd.timerfd(rtc=True, nonBlocking=True)
+        self._rv_timer = linuxfd.timerfd(rtc=True, nonBlocking=True)
+        self._pos_timer = linuxfd.timerfd(rtc=True, nonBlocking=True)
+        self._thermal_timer = linuxfd.timerfd(rtc=True, nonBlocking=True)
 
         # FIXME: log messages at AOS, Max el, LOS
         times, az, el = pos
-        # first time above min_el
-        aos = times[np.argmax(el.degrees > self.min_el)]
-        # last time above min_el
-        los = times[len(el.degrees) - 1 - np.argmax(np.flip(el.degrees) > self.min_el)]
-
-        logger.info("AOS: %s", aos.utc_datetime())
-        logger.info("LOS: %s", los.utc_datetime())
-
-        self.action = {
-            aosfd.fileno(): partial(self.on_rise, aosfd),
-            losfd.fileno(): partial(self.on_fall, losfd),
-            rotfd.fileno(): partial(
-                self.on_rotator, rotfd, (iter(nav[0]), iter(nav[1].degrees), iter(nav[2].degrees))
-            ),
-            radfd.fileno(): partial(self.on_rx_doppler, radfd, (iter(rv[0]), iter(rv[1].m_per_s))),
-            posfd.fileno(): partial(
-                self.on_pos, posfd, (iter(times), iter(az.degrees), iter(el.degrees))
-            ),
-            thmfd.fileno(): partial(self.on_thermal, thmfd),
+        aos, los = self._aos_los(el)
+
+        logger.info("AOS: %s", times[aos].utc_datetime())
+        logger.info("LOS: %s", times[los].utc_datetime())
+
+        # Handlers are plain bound methods, everything they work from lives on self for the pass
+        self._nav, self._rv, self._pos = self._steps(pos, nav, rv)
+        # Nothing below needs skyfield, don't keep its arrays and caches alive for the whole pass
+        del pos, nav, rv, times, az, el
+        # Index of the step each periodic timer last acted on. The rotator and doppler lead the
+        # satellite, the first expiry at the start of the track commands step 1, while the
+        # position log follows it and reports step 0.
+        self._nav_idx = 0
+        self._rv_idx = 0
+        self._pos_idx = -1
+
+        self.action: dict[int, Callable[[int], bool]] = {
+            self._aos_timer.fileno(): self.on_rise,
+            self._los_timer.fileno(): self.on_fall,
+            self._nav_timer.fileno(): self.on_rotator,
+            self._rv_timer.fileno(): self.on_rx_doppler,
+            self._pos_timer.fileno(): self.on_pos,
+            self._thermal_timer.fileno(): self.on_thermal,
         }
 
         self.edl: socket.socket | None = None
@@ -123,31 +294,37 @@ class SinglePass:
         # Orient antenna to where the satellite wil rise
         # FIXME: compensate for slew rate, point at midpointish thing
         try:
-            self.pre_position(nav[1].degrees[0], nav[2].degrees[0])
-
-            self.epoll.register(aosfd.fileno(), select.EPOLLIN)
-            self.epoll.register(losfd.fileno(), select.EPOLLIN)
-            self.epoll.register(rotfd.fileno(), select.EPOLLIN)
-            self.epoll.register(radfd.fileno(), select.EPOLLIN)
-            self.epoll.register(posfd.fileno(), select.EPOLLIN)
-            self.epoll.register(thmfd.fileno(), select.EPOLLIN)
-
-            aosfd.settime(aos.utc_datetime().timestamp(), absolute=True)
-            losfd.settime(los.utc_datetime().timestamp(), absolute=True)
-            rotfd.settime(nav[0][0].utc_datetime().timestamp(), absolute=True)
-            radfd.settime(rv[0][0].utc_datetime().timestamp(), absolute=True)
-            posfd.settime(pos[0][0].utc_datetime().timestamp(), absolute=True)
-            thmfd.settime(self.ts.now().utc_datetime().timestamp(), absolute=True)
+            # Doppler for every step of the pass at once, ticks then only index into it
+            self._doppler = (self.rad.rx_frequency(self._rv[1]), self.rad.tx_frequency(self._rv[1]))
+            self.pre_position(self._nav[1][0], self._nav[2][0])
+
+            for fd in self.action:
+                self.epoll.register(fd, select.EPOLLIN)
+
+            self._aos_timer.settime(self._pos[0][aos], absolute=True)
+            self._los_timer.settime(self._pos[0][los], absolute=True)
+            # Tracks are evenly spaced so arm each once as periodic, see _advance()
+            for timer, (times, *_) in (
+                (self._nav_timer, self._nav),
+                (self._rv_timer, self._rv),
+                (self._pos_timer, self._pos),
+            ):
+                timer.settime(times[0], self._period(times), absolute=True)
+            # Check temperature now and every 30s after
+            self._thermal_timer.settime(time(), 30, absolute=True)
 
             stop = False
-            while not stop:
-                for fd, event in self.epoll.poll(-1):
-                    try:
-                        logger.debug("%s", self.action[fd])
-                        if stop := not self.action[fd](event):
-                            break
-                    except StopIteration:
-                        self.epoll.unregister(fd)
+            with _realtime() if self.conf.realtime else nullcontext():
+                while not stop:
+                    for fd, event in self.epoll.poll(-1):
+                        try:
+                            logger.debug("%s", self.action[fd])
+                            if stop := not self.action[fd](event):
+                                break
+                        except StopIteration:
+                            # Finished tracks stay registered but silenced, every pass starts
+                            # with a fresh epoll anyway
+                            self.epoll.modify(fd, 0)
         except Exception:
             # It'll take a while to get through the finally block so notify the user early on error
             logger.exception("!!Work pass interrupted:")
@@ -155,19 +332,94 @@ class SinglePass:
         finally:
             self.reset_hardware()
 
+    def _aos_los(self, el: Angle) -> tuple[int, int]:
+        '''Find the indices of the first and last time above min_el.'''
+        above = np.flatnonzero(el.degrees > self.min_el)
+        if above.size == 0:
+            # e.g. point(), which holds el at 0. Treat the whole track as the pass.
+            logger.warning("Track never rises above %d°el, using the whole track", self.min_el)
+            return 0, len(el.degrees) - 1
+        return int(above[0]), int(above[-1])
+
+    @classmethod
+    def _steps(
+        cls,
+        pos: tuple[Time, Angle, Angle],
+        nav: tuple[Time, Angle, Angle],
+        rv: tuple[Time, Velocity],
+    ) -> tuple[
+        tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]],
+        tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]],
+        tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]],
+    ]:
+        '''Convert the tracks up front to plain arrays of POSIX timestamps, degrees and m/s.
+
+        Handlers then only need to advance an index each step. Returns the nav, rv and pos steps.
+        '''
+        return (
+            (cls._timestamps(nav[0]), nav[1].degrees, nav[2].degrees),
+            (cls._timestamps(rv[0]), rv[1].m_per_s),
+            (cls._timestamps(pos[0]), pos[1].degrees, pos[2].degrees),
+        )
+
+    @staticmethod
+    def _timestamps(times: Time) -> npt.NDArray[np.float64]:
+        '''Convert a Time array to POSIX timestamps, as timerfd wants.
+
+        Vectorized equivalent of utc_datetime().timestamp() on every element. toordinal() is UTC
+        days since 0001-01-01 so leap seconds are already accounted for.
+        '''
+        return (np.asarray(times.toordinal(), dtype=np.float64) - _UNIX_ORDINAL) * 86400
+
+    @staticmethod
+    def _period(times: npt.NDArray[np.float64]) -> float:
+        '''Step size of an evenly spaced track, 0 (one-shot) if there's only one step.'''
+        if len(times) < 2:
+            return 0.0
+        return float(times[-1] - times[0]) / (len(times) - 1)
+
+    @staticmethod
+    def _advance(timer: linuxfd.timerfd, start: int, length: int, name: str) -> int:
+        '''Consume a periodic track timer, returning the index of the step to act on.
+
+        The timer counts every period that elapsed since it was last read so a late wakeup
+        skips straight to the current step instead of replaying the missed ones. Raises
+        StopIteration, disarming the timer, when the track is finished.
+        '''
+        expirations: int = timer.read()
+        if expirations > 1:
+            logger.info('%-28s%d steps', f'Skipping {name}', expirations - 1)
+        step = start + expirations
+        if step >= length:
+            timer.settime(0)
+            raise StopIteration
+        return step
+
     def reset_hardware(self) -> None:
         logger.info("Pass ending, safing hardware")
-        self.sta.ptt_off()
-        if self.edl is not None:
-            self.edl.close()
-        self.uhf.lna_off()
-        self.rad.set_tx_gain(3)
-
-        self.rot.park()
-        logger.info("Parked rotator")
-        logger.info("Waiting %ds for PA to cool", self.cooloff_delay)
-        sleep(self.cooloff_delay)
-        self.sta.pa_off()
+        # Only touch hardware connected this pass. Anything else was never turned on, and
+        # connecting to it now could fail and hide whatever error ended the pass.
+        connected = self.__dict__
+        try:
+            if 'sta' in connected:
+                self.sta.ptt_off()
+            if self.edl is not None:
+                self.edl.close()
+            if 'uhf' in connected:
+                self.uhf.lna_off()
+            if 'rad' in connected:
+                self.rad.set_tx_gain(3)
+
+            if 'rot' in connected:
+                self.rot.park()
+                logger.info("Parked rotator")
+            if 'sta' in connected:
+                # Deliberately not a Sleeper, cutting this short could damage the PA
+                logger.info("Waiting %ds for PA to cool", self.cooloff_delay)
+                sleep(self.cooloff_delay)
+                self.sta.pa_off()
+        finally:
+            self.release_hardware()
 
     def ident(self) -> bool:
         # The identifier must be sent
@@ -191,15 +443,21 @@ class SinglePass:
         # FIXME: guess from slew rate about how long it would take instead of
         # waiting indefinitely. We'll need some way of finding slew rate first
         # though.
-        events = self.epoll.poll(-1)
-        if len(events) > 1:
-            raise RuntimeError("More events than expected")
-        if events[0][0] != self.rot.listener:
-            raise RuntimeError("Unexpected event fired")
-        self.epoll.unregister(self.rot.listener)
+        # Only the rotator matters here, wait on it alone rather than through the pass epoll
+        poller = select.poll()
+        poller.register(self.rot.listener, select.POLLIN)
+        ((_, event),) = poller.poll()
         pos = self.rot.event()  # clears the event
         logger.info("pre-position arrived at %s", pos)
-        self.on_positioned(events[0][1])
+        self.on_positioned(event)
+
+        # Ready the EDL socket ahead of time so on_rise only has to bind it. Binding waits for AOS
+        # so nothing queues up to be sent before then.
+        self.edl = socket.socket(
+            socket.AF_INET, socket.SOCK_DGRAM | socket.SOCK_NONBLOCK | socket.SOCK_CLOEXEC
+        )
+        if self.conf.realtime:
+            self._busy_poll(self.edl)
 
     def on_positioned(self, _event: int) -> bool:
         logger.info("Rotator at initial position, enabling pa, lna")
@@ -210,46 +468,45 @@ class SinglePass:
         logger.info("Initial position tasks complete")
         return True
 
-    def on_rotator(
-        self, timer: linuxfd.timerfd, nav: tuple[Time, Angle, Angle], _event: int
-    ) -> bool:
-        timer.read()
-        time, az, el = next(nav[0]), next(nav[1]), next(nav[2])
-        while time < self.ts.now():
-            logger.info(
-                '%-28s%s %7.3f°az %7.3f°el',
-                'Skipping nav',
-                time.utc_datetime(),
-                az,
-                el,
-            )
-            time, az, el = next(nav[0]), next(nav[1]), next(nav[2])
-        timer.settime(time.utc_datetime().timestamp(), absolute=True)
-        self.rot.go(AzEl(az, el))
+    def on_rotator(self, _event: int) -> bool:
+        _, az, el = self._nav
+        i = self._nav_idx = self._advance(self._nav_timer, self._nav_idx, len(az), 'nav')
+        self.rot.go(AzEl(az[i], el[i]))
         return True
 
-    def on_pos(self, timer: linuxfd.timerfd, pos: tuple[Time, Angle, Angle], _event: int) -> bool:
-        timer.read()
-        time, az, el = next(pos[0]), next(pos[1]), next(pos[2])
-        logger.info('%-28s: %7.3f°az %7.3f°el', "Satellite position", az, el)
-        timer.settime(time.utc_datetime().timestamp(), absolute=True)
+    def on_pos(self, _event: int) -> bool:
+        _, az, el = self._pos
+        i = self._pos_idx = self._advance(self._pos_timer, self._pos_idx, len(az), 'position')
+        logger.info('%-28s: %7.3f°az %7.3f°el', "Satellite position", az[i], el[i])
         return True
 
-    def on_rise(self, timer: linuxfd.timerfd, _event: int) -> bool:
-        logger.info("AOS %s", timer.read())
+    def on_rise(self, _event: int) -> bool:
+        logger.info("AOS %s", self._aos_timer.read())
         self.rad.set_tx_selector("edl")
         self.sta.ptt_on()
 
-        self.edl = socket.socket(socket.AF_INET, socket.SOCK_DGRAM | socket.SOCK_NONBLOCK)
+        if self.edl is None:
+            raise RuntimeError("EDL socket not created, pre_position() must run first")
         self.edl.bind(self.conf.edl)
         logger.info("EDL socket open")
-        self.epoll.register(self.edl.fileno(), select.EPOLLIN | select.EPOLLERR)
-        self.action[self.edl.fileno()] = partial(self.on_edl, self.edl)
+        # EPOLLERR and EPOLLHUP are always reported, recv errors surface in on_edl
+        self.epoll.register(self.edl.fileno(), select.EPOLLIN)
+        self.action[self.edl.fileno()] = self.on_edl
         return True
 
+    @staticmethod
+    def _busy_poll(sock: socket.socket, usec: int = 50) -> None:
+        # Busy poll the NIC queue on receive instead of waiting for the interrupt, trading CPU for
+        # EDL latency. Raising it above net.core.busy_read needs CAP_NET_ADMIN.
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, _SO_BUSY_POLL, usec)
+            sock.setsockopt(socket.SOL_SOCKET, _SO_PREFER_BUSY_POLL, 1)
+        except OSError as e:
+            logger.warning("Not permitted to busy poll EDL socket, continuing without: %s", e)
+
     # FIXME: setup on_fall in on_rise so that self.edl can be local
-    def on_fall(self, timer: linuxfd.timerfd, _event: int) -> bool:
-        logger.info("LOS %s", timer.read())
+    def on_fall(self, _event: int) -> bool:
+        logger.info("LOS %s", self._los_timer.read())
         if self.edl is not None:
             self.edl.close()
         self.edl = None
@@ -258,34 +515,44 @@ class SinglePass:
         self.sta.ptt_off()
         return False
 
-    def on_edl(self, edl: socket.socket, _event: int) -> bool:
-        packet = edl.recv(4096)
-        # FIXME: Recalculate current range_vel for exact time?
-        self.rad.edl(packet, self.current_rv)
-        logger.info("Sent EDL")
+    def _edl_packets(self, edl: socket.socket) -> Iterator[memoryview]:
+        # Each packet is only valid until the next one is requested, they share _edl_buf
+        while True:
+            try:
+                size = edl.recv_into(self._edl_buf)
+            except BlockingIOError:
+                return
+            yield self._edl_buf[:size]
+
+    def on_edl(self, _event: int) -> bool:
+        if self.edl is None:
+            # Already closed at LOS
+            return True
+        # Drain everything queued so a burst costs one epoll wakeup instead of one per packet
+        packets = self._edl_packets(self.edl)
+        first = next(packets, None)
+        if first is not None:
+            # FIXME: Recalculate current range_vel for exact time?
+            self.rad.edl_batch(chain((first,), packets), self.current_rv)
+            logger.info("Sent EDL")
         return True
 
-    def on_rx_doppler(self, timer: linuxfd.timerfd, rv: Velocity, _event: int) -> bool:
-        timer.read()
-        time, range_velocity = next(rv[0]), next(rv[1])
-        while time < self.ts.now():
-            logger.info(
-                '%-28s%s %7.3f rv',
-                'Skipping doppler',
-                time.utc_datetime(),
-                range_velocity,
-            )
-            time, range_velocity = next(rv[0]), next(rv[1])
-
-        timer.settime(time.utc_datetime().timestamp(), absolute=True)
+    def on_rx_doppler(self, _event: int) -> bool:
+        _, range_velocity = self._rv
+        i = self._rv_idx = self._advance(
+            self._rv_timer, self._rv_idx, len(range_velocity), 'doppler'
+        )
         # FIXME: set doppler to point that minimizes error over the interval (midpoint?)
-        self.current_rv = range_velocity
+        self.current_rv = float(range_velocity[i])
         logger.debug("doppler %f", self.current_rv)
-        self.rad.set_rx_frequency(self.current_rv)
+        # TX only matters during EDL but keeping it current costs nothing extra when batched.
+        # xmlrpc can't marshal numpy scalars.
+        rx, tx = self._doppler
+        self.rad.set_frequencies(float(rx[i]), float(tx[i]))
         return True
 
-    def on_thermal(self, timer: linuxfd.timerfd, _event: int) -> bool:
-        timer.read()
+    def on_thermal(self, _event: int) -> bool:
+        self._thermal_timer.read()
 
         degc = self.sta.gettemp()
         if degc > self.conf.temp_limit:
@@ -295,7 +562,6 @@ class SinglePass:
                 self.conf.temp_limit,
             )
             raise RuntimeError("Temperature too high")
-        timer.settime(self.ts.now().utc_datetime().timestamp() + 30, absolute=True)
         return True
 
 
@@ -304,19 +570,32 @@ class Commander:
         '''Create the main pass coordinator.'''
         self.conf = conf
         self.track = Tracker(conf.observer, owmid=conf.owmid)
+        self.sleeper = Sleeper()
         self.singlepass = SinglePass(conf)
 
+    def cancel(self) -> None:
+        '''Cut short whatever wait is in progress, from another thread or a signal handler.
+
+        While waiting for the next pass this recomputes it, e.g. to pick up a fresh TLE. Passes
+        themselves are not interrupted, a cancel sent during one wakes the next wait instead.
+        '''
+        self.sleeper.cancel()
+
+    def close(self) -> None:
+        self.sleeper.close()
+
     def require_clock_sync(self) -> None:
         def ntp_synchronized() -> bool:
-            # FIXME: Paraphrased from man org.freedesktop.timedate1:
+            # Paraphrased from man org.freedesktop.timedate1:
             # NTPSynchronized shows whether the kernel reports the time as
             # synchronized, reported by the system call adjtimex(3). The purpose of
             # this D-Bus property is to allow remote clients to access this
             # information. Local clients can access the information directly.
             #
-            # I'd prefer to not use D-Bus but I can't find any existing Python
-            # bindings for adjtimex() and the struct argument is sufficiently
-            # complicated that I don't really want to write my own ctypes binding.
+            # So ask the kernel ourselves and only go through D-Bus if that fails.
+            synced = _adjtimex_synchronized()
+            if synced is not None:
+                return synced
             msg = Properties(
                 DBusAddress(
                     object_path='/org/freedesktop/timedate1',
@@ -329,7 +608,7 @@ class Commander:
 
         while not ntp_synchronized():
             logger.warning("System clock is not synchronized. Sleeping 60 seconds.")
-            sleep(60)
+            self.sleeper.sleep(60)
         logger.info("System clock is synchronized.")
 
     def sleep_until_next_pass(self) -> tuple[Satellite, PassInfo]:
@@ -363,7 +642,9 @@ class Commander:
 
             tle_refresh = timedelta(days=1)
             # FIXME: wake up a bit before a pass to adjust TLEs?
-            sleep(min(to_sleep.total_seconds(), tle_refresh.total_seconds()))
+            if not self.sleeper.sleep(min(to_sleep.total_seconds(), tle_refresh.total_seconds())):
+                logger.info("Woken early, recomputing next pass")
+                continue
 
             tle_age = timedelta(days=self.track.ts.now() - sat.epoch)
             if tle_age <= tle_refresh:
@@ -388,6 +669,7 @@ class Commander:
 
             seconds = timedelta(days=np.fall.time - self.track.ts.now()).total_seconds()
             if seconds > 0:
+                # Not cancellable, waking early would find this same pass again and rerun it
                 logger.info("Sleeping %.3f seconds until pass is really over.", seconds)
                 sleep(seconds)
             count -= 1
@@ -413,11 +695,11 @@ class Commander:
         # Python can't represent dates more than 10,000 years in the future and timerfds don't do
         # 10,000 days(?) so 1,000 days is now forever.
         times = self.track.ts.linspace(now, now + 1000, 2)
-        pos = (times, Angle(radians=[az, az]), Angle(degrees=[0, 0]))
-        nav = (times, Angle(radians=[az, az]), Angle(degrees=[0, 0]))
-        rv = (times, Velocity.m_per_s([0, 0]))
+        # Satellite and antenna are in the same place, nothing reads these in place so share them
+        pos = (times, Angle(radians=np.array([az, az])), Angle(degrees=np.zeros(2)))
+        rv = (times, Velocity.m_per_s(np.zeros(2)))
 
-        self.singlepass.work(pos, nav, rv)
+        self.singlepass.work(pos, pos, rv)
 
     def dryrun(self) -> None:
         sat = Satellite(
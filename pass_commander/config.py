@@ -1,17 +1,18 @@
+import tomllib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from dataclasses import InitVar, dataclass, field
+from functools import lru_cache
 from ipaddress import AddressValueError, IPv4Address
 from numbers import Real
 from pathlib import Path, PosixPath
 from socket import gaierror, gethostbyname
 from typing import Any, NamedTuple, TypeAlias
 
-import tomlkit
 from sgp4 import earth_gravity, io
 from skyfield.api import E, N, wgs84
 from skyfield.toposlib import GeographicPosition
 from skyfield.units import Angle
-from tomlkit.items import Table
-from tomlkit.toml_document import TOMLDocument
 
 
 class ConfigError(Exception):
@@ -93,46 +94,83 @@ TleCache: TypeAlias = dict[str, list[str]]
 _marker = object()  # marks no default value, in case we want None as default
 
 
-def _pop_table(cfg: TOMLDocument, table: str, default: Any = _marker) -> Any:  # noqa: ANN401
+class _Table(dict[str, Any]):
+    def __init__(self, name: str, entries: dict[str, Any]) -> None:
+        '''Wrap a parsed TOML table, remembering its name for error messages.'''
+        super().__init__(entries)
+        self.display_name = name
+
+
+def _pop_table(cfg: dict[str, Any], table: str, default: Any = _marker) -> _Table:  # noqa: ANN401
     try:
         entry = cfg.pop(table)
-        if not isinstance(entry, Table):
+        if not isinstance(entry, dict):
             raise UnknownKeyError([table])
-    except tomlkit.exceptions.NonExistentKey as e:
+    except KeyError as e:
         if default is _marker:
             raise MissingTableError(table) from e
         entry = default
-    return entry
+    return _Table(table, entry)
 
 
-def _pop(table: Table, key: str, valtype: type, default: Any = _marker) -> Any:  # noqa: ANN401
+def _pop(table: _Table, key: str, valtype: type, default: Any = _marker) -> Any:  # noqa: ANN401
     try:
         val = table.pop(key)
-    except tomlkit.exceptions.NonExistentKey as e:
+    except KeyError as e:
         if default is _marker:
             raise MissingKeyError(table.display_name, key) from e
         val = default
-    if not isinstance(val, valtype):
+    # TOML booleans come back as Python bools, which would otherwise pass as int and Real
+    if not isinstance(val, valtype) or (isinstance(val, bool) and valtype is not bool):
         raise KeyValidationError(table.display_name, key, valtype.__name__, type(val).__name__)
     return val
 
 
-def _pop_ip(table: Table, key: str, valtype: type, default: Any = _marker) -> IPv4Address:  # noqa: ANN401
-    value = _pop(table, key, valtype, default)
+@lru_cache(maxsize=128)
+def _resolve(host: str) -> IPv4Address:
+    '''Resolve a hostname, skipping DNS entirely for plain IP addresses.'''
     try:
-        return IPv4Address(gethostbyname(value))
-    except (AddressValueError, gaierror) as e:
-        raise IpValidationError(table.display_name, key, value) from e
+        return IPv4Address(host)
+    except AddressValueError:
+        return IPv4Address(gethostbyname(host))
+
 
+def _pop_ips(table: _Table, *keys: str) -> list[IPv4Address]:
+    '''Pop hostnames and resolve them, looking up all that need DNS at once.'''
+    values = {key: _pop(table, key, str) for key in keys}
 
-def _check_template_text(config: TOMLDocument) -> None:
+    def resolve(key: str) -> IPv4Address:
+        try:
+            return _resolve(values[key])
+        except (AddressValueError, gaierror) as e:
+            raise IpValidationError(table.display_name, key, values[key]) from e
+
+    ips: dict[str, IPv4Address] = {}
+    for key, value in values.items():
+        with suppress(AddressValueError):
+            ips[key] = IPv4Address(value)
+    # Usually every host is an IP address, don't start threads just to parse them
+    names = [key for key in keys if key not in ips]
+    if names:
+        with ThreadPoolExecutor(max_workers=len(names)) as pool:
+            ips.update(zip(names, pool.map(resolve, names), strict=True))
+    return [ips[key] for key in keys]
+
+
+def _check_template_text(config: dict[str, Any]) -> None:
     '''Ensure all template text has been removed.'''
-    for name, table in config.items():
-        if not isinstance(table, Table):
-            continue
-        for key, value in table.items():
-            if isinstance(value, str) and '<' in value:
-                raise TemplateTextError(name, key)
+    found = next(
+        (
+            (name, key)
+            for name, table in config.items()
+            if isinstance(table, dict)
+            for key, value in table.items()
+            if isinstance(value, str) and '<' in value
+        ),
+        None,
+    )
+    if found is not None:
+        raise TemplateTextError(*found)
 
 
 @dataclass
@@ -169,6 +207,7 @@ class Config:
     # Command line only
     mock: set[str] = field(default_factory=set)
     pass_count: int = 9999
+    realtime: bool = False
     # FIXME: use XDG_CONFIG_HOME
     dir: PosixPath = PosixPath('~/.config/OreSat').expanduser()  # noqa: RUF009
 
@@ -194,8 +233,8 @@ class Config:
         self.dir = PosixPath(path.parent)
 
         try:
-            config = tomlkit.parse(path.read_text())
-        except tomlkit.exceptions.ParseError as e:
+            config = tomllib.loads(path.read_text())
+        except tomllib.TOMLDecodeError as e:
             raise InvalidTomlError(*e.args) from e
         except FileNotFoundError as e:
             raise ConfigNotFoundError from e
@@ -212,8 +251,7 @@ class Config:
         self.txgain = int(_pop(main, 'txgain', int))
 
         hosts = _pop_table(config, 'Hosts')
-        radio = _pop_ip(hosts, 'radio', str)
-        station = _pop_ip(hosts, 'station', str)
+        radio, station = _pop_ips(hosts, 'radio', 'station')
         self.edl_dest = (str(radio), self.edl_dest[1])
         self.flowgraph = (str(radio), self.flowgraph[1])
         self.station = (str(station), self.station[1])
@@ -231,7 +269,7 @@ class Config:
             raise AngleValidationError(
                 observer.display_name, 'lon', self.observer.longitude.degrees
             )
-        self.name = str(_pop(observer, 'name', str))  # XMLRPC can't handle toml subclass
+        self.name = str(_pop(observer, 'name', str))
         self.temp_limit = float(_pop(observer, 'temperature-limit', Real, self.temp_limit))
 
         self.tle_cache = dict(_pop_table(config, 'TleCache', {}))
@@ -242,16 +280,19 @@ class Config:
             except (IndexError, ValueError) as e:
                 raise TleValidationError(key, tle) from e
 
-        # Ensure there's no extra keys
-        extra = ['Main.' + k for k in main]
-        extra.extend('Hosts.' + k for k in hosts)
-        extra.extend('Observer.' + k for k in observer)
-        extra.extend(k for k in config)
-        if extra:
+        # Ensure there's no extra keys, everything known has been popped by now
+        if main or hosts or observer or config:
+            extra = ['Main.' + k for k in main]
+            extra.extend('Hosts.' + k for k in hosts)
+            extra.extend('Observer.' + k for k in observer)
+            extra.extend(k for k in config)
             raise UnknownKeyError(extra)
 
     @classmethod
     def template(cls, path: Path) -> None:
+        # Only needed to write comments, loading uses the much lighter stdlib tomllib
+        import tomlkit  # noqa: PLC0415
+
         config = tomlkit.document()
         config.add(tomlkit.comment("Be sure to replace all <hint text> including angle brackets"))
         config.add(tomlkit.comment("Optional fields are commented out, uncomment to set"))
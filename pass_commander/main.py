@@ -1,12 +1,12 @@
 import logging
+import signal
 from argparse import ArgumentParser, Namespace, RawTextHelpFormatter
 from pathlib import Path
 from textwrap import dedent
 
 from skyfield.api import E, N, wgs84
 
-from . import config, mock
-from .commander import Commander
+from . import config
 
 logger = logging.getLogger(__name__)
 
@@ -96,6 +96,15 @@ def handle_args() -> Namespace:  # noqa: D103
         type=float,
         help="Temperature in Celsius of the station above which prevents a pass from running",
     )
+    parser.add_argument(
+        "--realtime",
+        action="store_true",
+        help=dedent(
+            """\
+            Run the pass event loop with realtime (SCHED_FIFO) priority and locked memory.
+            Requires CAP_SYS_NICE and CAP_IPC_LOCK, or rtprio/memlock limits"""
+        ),
+    )
     parser.add_argument(
         "-p",
         "--point",
@@ -163,8 +172,14 @@ def main() -> None:  # noqa: D103 C901 PLR0912 PLR0915
             )
             return
         conf.pass_count = args.pass_count
+        conf.realtime = args.realtime
         conf.temp_limit = args.temperature_limit or conf.temp_limit
 
+        # Deferred so --help, --template, and config errors don't pay for importing the hardware
+        # bindings and event loop
+        from . import mock  # noqa: PLC0415
+        from .commander import Commander  # noqa: PLC0415
+
         mock_edl = None
         mock_flowgraph = None
         mock_stationd = None
@@ -192,6 +207,8 @@ def main() -> None:  # noqa: D103 C901 PLR0912 PLR0915
             conf.rotator = mock_rotator.client_path
 
         commander = Commander(conf)
+        # `kill -USR1` cuts short the wait for the next pass, e.g. after updating the TLE cache
+        signal.signal(signal.SIGUSR1, lambda _sig, _frame: commander.cancel())
 
         try:
             if args.point is not None:
@@ -207,6 +224,8 @@ def main() -> None:  # noqa: D103 C901 PLR0912 PLR0915
             else:
                 logger.info("Unknown action: %s", args.action)
         finally:
+            signal.signal(signal.SIGUSR1, signal.SIG_DFL)
+            commander.close()
             # TODO: context manager/closeable for mocks?
             if mock_edl is not None:
                 mock_edl.close()
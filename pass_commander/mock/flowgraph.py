@@ -95,13 +95,16 @@ class FlowgraphState:
 
 
 class Flowgraph:
-    def __init__(self, addr: tuple[str, int] | None = None) -> None:
+    def __init__(self, addr: tuple[str, int] | None = None, *, multicall: bool = True) -> None:
         '''Simulate xmlrpc flowgraph interface for testing.
 
         Parameters
         ----------
         addr
             IP address and port to listen on, usually localhost or some loopback.
+        multicall
+            Register system.multicall. Real GNU Radio flowgraphs don't, so set False to test
+            the fallback.
         '''
         if addr is None:
             addr = ('127.0.0.1', 0)
@@ -109,6 +112,8 @@ class Flowgraph:
         self._server = SimpleXMLRPCServer(addr, allow_none=True, logRequests=False)
         self._addr: tuple[str, int] = self._server.socket.getsockname()
         self._server.register_instance(self._state)
+        if multicall:
+            self._server.register_multicall_functions()
 
         self._r, self._w = os.pipe2(os.O_NONBLOCK)
         self._thread = Thread(target=self._run)
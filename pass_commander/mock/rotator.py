@@ -2,6 +2,7 @@ import logging
 from ctypes import c_char_p, cdll
 from pathlib import PosixPath
 from threading import Thread
+from time import sleep
 from typing import Literal
 
 import serial
@@ -54,19 +55,20 @@ class PtyRotator(ROT2ProgSim):  # type: ignore[misc]
         self._ser.cancel_read()
 
     def _run(self) -> None:
-        # Because upstream doesn't handle cancel_read it sometimes OSError: Errno 5
-        try:
-            super()._run()
-        except OSError as e:
-            # It's actually a SerialException but it doesn't set errno
-            if str(e) != 'read failed: [Errno 5] Input/output error':
-                raise
+        # Because upstream doesn't handle cancel_read it sometimes OSError: Errno 5. The same error
+        # comes from the client closing its end, keep serving until it reopens like a real port.
+        while self._keep_running:
+            try:
+                super()._run()
+            except OSError as e:
+                # It's actually a SerialException but it doesn't set errno
+                if str(e) != 'read failed: [Errno 5] Input/output error':
+                    raise
+                sleep(0.01)
         self._log.info("Stopped")
 
 
 if __name__ == '__main__':
-    from time import sleep
-
     rot = PtyRotator(1)
     print(rot.client_path)  # noqa: T201
     try:
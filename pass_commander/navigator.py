@@ -2,8 +2,7 @@ from __future__ import annotations
 
 import logging
 from abc import ABCMeta, abstractmethod
-from math import cos, pi
-from math import degrees as deg
+from math import cos, pi, tau
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -51,7 +50,9 @@ class Navigator(metaclass=ABCMeta):
         if cls.no_zero_cross(info.rise.az.radians, info.culm[0].az.radians, info.fall.az.radians):
             return Straight(info)
         if cls.no_zero_cross(
-            *cls.rot_pi((info.rise.az.radians, info.culm[0].az.radians, info.fall.az.radians))
+            cls.rot_pi(info.rise.az.radians),
+            cls.rot_pi(info.culm[0].az.radians),
+            cls.rot_pi(info.fall.az.radians),
         ):
             return Backhand(info)
         # FIXME This probably means we need to extend into the 450°
@@ -70,20 +71,21 @@ class Navigator(metaclass=ABCMeta):
 
         z = (abs(rise - culm) + abs(culm - fall)) > (1.5 * pi)
         return ''.join(
-            f"rise: {rise_time} {deg(rise):.1f}°az\n"
+            f"rise: {rise_time} {self.info.rise.az.degrees:.1f}°az\n"
             f"culm: {culm_time} {self.info.culm[0].el.degrees:.1f}°el\n"
-            f"fall: {fall_time} {deg(fall):.1f}°az\n"
+            f"fall: {fall_time} {self.info.fall.az.degrees:.1f}°az\n"
             f"Zero_cross: {z} mode: {self.__class__.__name__}",
         )
 
     @staticmethod
-    def rot_pi(rad: tuple[float, ...]) -> tuple[float, ...]:
-        """Rotate any radian by half a circle."""
-        return tuple((x + pi) % (2 * pi) for x in rad)
+    def rot_pi(rad: float) -> float:
+        """Rotate a radian by half a circle."""
+        return (rad + pi) % tau
 
     @staticmethod
     def no_zero_cross(a: float, b: float, c: float) -> bool:
-        return (a < b < c) or (a > b > c)
+        # Strictly monotonic iff both steps have the same sign, equal neighbours give 0
+        return (b - a) * (c - b) > 0
 
     @staticmethod
     def az_n_hem(az: float) -> bool:
@@ -101,7 +103,7 @@ class Straight(Navigator):
 
 class Backhand(Navigator):
     def azel(self, az: Angle, el: Angle) -> tuple[Angle, Angle]:
-        return (Angle(radians=(az.radians + pi) % (2 * pi)), Angle(radians=pi - el.radians))
+        return (Angle(radians=(az.radians + pi) % tau), Angle(radians=pi - el.radians))
 
 
 class Flip(Navigator):
@@ -118,10 +120,10 @@ class Flip(Navigator):
         super().__init__(info)
         # halfway point between rise and (fall + halfcircle)
         # FIXME: verify average works on circle
-        flip_az = ((info.rise.az.radians + info.fall.az.radians + pi) / 2) % (2 * pi)
+        flip_az = ((info.rise.az.radians + info.fall.az.radians + pi) / 2) % tau
         # FIXME: I can't convince myself that this is correct yet
         if self.az_n_hem(flip_az):
-            (flip_az,) = self.rot_pi((flip_az,))
+            flip_az = self.rot_pi(flip_az)
 
         self.flip_az = Angle(radians=flip_az)
 
@@ -132,8 +134,13 @@ class Flip(Navigator):
         # we need to pick the el at each step that minimizes the error between antenna and target.
         # FIXME: Still working on reasoning this out. For example I'd expect at 0 target el this
         #        would set 0 antenna el, but it doesn't.
-        flip_el = pi / 2 - (np.cos(az.radians - self.flip_az.radians) * (pi / 2 - el.radians))
-        return (Angle(radians=np.full(len(flip_el), self.flip_az.radians)), Angle(radians=flip_el))
+        # Computes pi/2 - cos(az - flip_az) * (pi/2 - el) for the whole pass, reusing one
+        # scratch array instead of allocating a temporary per operation.
+        flip_el = np.subtract(az.radians, self.flip_az.radians, dtype=np.float64)
+        np.cos(flip_el, out=flip_el)
+        flip_el *= el.radians - pi / 2
+        flip_el += pi / 2
+        return (Angle(radians=np.full_like(flip_el, self.flip_az.radians)), Angle(radians=flip_el))
 
     def __str__(self) -> str:
         val = super().__str__()
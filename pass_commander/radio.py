@@ -1,17 +1,28 @@
 import logging
 import socket
+from collections.abc import Iterable
 from threading import Lock
 from time import sleep
-from xmlrpc.client import ServerProxy
+from typing import overload
+from xmlrpc.client import Fault, MultiCall, ServerProxy
 
+import numpy as np
+import numpy.typing as npt
 from skyfield import constants
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for the morse ident to finish transmitting
+DEFAULT_MORSE_DELAY = 4.0
+
 
 class Radio:
     def __init__(
-        self, flowgraph: tuple[str, int], edl: tuple[str, int], name: str, morse_delay: float = 4.0
+        self,
+        flowgraph: tuple[str, int],
+        edl: tuple[str, int],
+        name: str,
+        morse_delay: float = DEFAULT_MORSE_DELAY,
     ) -> None:
         '''Binding to the uniclogs-sdr GNURadio flowgraph.
 
@@ -29,12 +40,25 @@ class Radio:
         morse_delay
             duration in seconds to wait for the morse identifier broadcast to complete
         '''
-        self._edl = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        # EDL is fire and forget, never let a full send buffer stall the pass
+        self._edl = socket.socket(socket.AF_INET, socket.SOCK_DGRAM | socket.SOCK_NONBLOCK)
+        self._edl.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 256 * 1024)
         self._edl.connect(edl)
         self._lock = Lock()
         self._flowgraph = ServerProxy(f"http://{flowgraph[0]}:{flowgraph[1]}")
-        tx = self._flowgraph.get_tx_center_frequency()
-        rx = self._flowgraph.get_rx_target_frequency()
+        # Batching calls with system.multicall saves a round trip per extra call but it's up to
+        # the flowgraph to register it, so check once here and fall back to individual calls.
+        try:
+            multi = MultiCall(self._flowgraph)
+            multi.get_tx_center_frequency()
+            multi.get_rx_target_frequency()
+            result = multi()
+            tx, rx = result[0], result[1]
+            self._multicall = True
+        except Fault:
+            tx = self._flowgraph.get_tx_center_frequency()
+            rx = self._flowgraph.get_rx_target_frequency()
+            self._multicall = False
         if not isinstance(tx, float):
             raise TypeError("Flowgraph returned invalid tx type")
         if not isinstance(rx, float):
@@ -42,47 +66,96 @@ class Radio:
         self.txfreq = tx
         self.rxfreq = rx
         self.name = name
+        # Last selector we set, so ident() doesn't need a round trip to find what to restore
+        self._tx_selector: str | None = None
         # FIXME: infer default delay from name
         self.morse_delay = morse_delay
 
+    def _batch(self, *calls: tuple[str, object]) -> None:
+        # Caller must hold _lock. One round trip if the flowgraph supports multicall.
+        proxy: MultiCall | ServerProxy = (
+            MultiCall(self._flowgraph) if self._multicall else self._flowgraph
+        )
+        for name, arg in calls:
+            getattr(proxy, name)(arg)
+        if isinstance(proxy, MultiCall):
+            results = proxy()
+            # Faults in a multicall only raise when their result is read
+            for i in range(len(calls)):
+                results[i]
+
     def ident(self) -> None:
         old_selector = self.get_tx_selector()
-        self.set_tx_selector("morse")
-        self.set_morse_ident(self.name)
+        logger.info("Selecting mode morse, sending morse ident %s", self.name)
+        with self._lock:
+            self._batch(("set_tx_selector", "morse"), ("set_morse_ident", self.name))
+            self._tx_selector = "morse"
         sleep(self.morse_delay)
         self.set_tx_selector(old_selector)
 
-    def rx_frequency(self, range_velocity: float) -> float:
+    @overload
+    def rx_frequency(self, range_velocity: float) -> float: ...
+    @overload
+    def rx_frequency(self, range_velocity: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]: ...
+    def rx_frequency(
+        self, range_velocity: float | npt.NDArray[np.float64]
+    ) -> float | npt.NDArray[np.float64]:
         # RX on the ground frequency. range_velocity is the satellite relative velocity, it
-        # starts negative and goes positive so the frequency starts high and goes low
-        return float(1 - range_velocity / constants.C) * self.rxfreq
+        # starts negative and goes positive so the frequency starts high and goes low. Works
+        # elementwise so the doppler for an entire pass can be computed in one go.
+        return (1 - range_velocity / float(constants.C)) * self.rxfreq
 
     def set_rx_frequency(self, range_velocity: float) -> None:
-        freq = self.rx_frequency(range_velocity)
-        logger.info("Set RX frequency %.1f", freq)
+        # xmlrpc can't marshal numpy scalars
+        freq = float(self.rx_frequency(range_velocity))
+        logger.debug("Set RX frequency %.1f", freq)
         with self._lock:
             self._flowgraph.set_gpredict_rx_frequency(freq)
 
-    def tx_frequency(self, range_velocity: float) -> float:
+    @overload
+    def tx_frequency(self, range_velocity: float) -> float: ...
+    @overload
+    def tx_frequency(self, range_velocity: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]: ...
+    def tx_frequency(
+        self, range_velocity: float | npt.NDArray[np.float64]
+    ) -> float | npt.NDArray[np.float64]:
         # TX is the opposite of RX, starts low, goes high
-        return float(1 + range_velocity / constants.C) * self.txfreq
+        return (1 + range_velocity / float(constants.C)) * self.txfreq
 
     def set_tx_frequency(self, range_velocity: float) -> None:
-        freq = self.tx_frequency(range_velocity)
-        logger.info("Set TX frequency %.1f", freq)
+        freq = float(self.tx_frequency(range_velocity))
+        logger.debug("Set TX frequency %.1f", freq)
         with self._lock:
             self._flowgraph.set_gpredict_tx_frequency(freq)
 
+    def set_frequencies(self, rx: float, tx: float) -> None:
+        '''Set already doppler shifted frequencies for a tick, see rx_frequency()/tx_frequency().
+
+        RX and TX go together in one round trip if multicall is supported. Without multicall only
+        RX is set, so each tick still costs a single round trip.
+        '''
+        with self._lock:
+            if not self._multicall:
+                logger.debug("Set RX frequency %.1f", rx)
+                self._flowgraph.set_gpredict_rx_frequency(rx)
+                return
+            logger.debug("Set RX frequency %.1f TX frequency %.1f", rx, tx)
+            self._batch(("set_gpredict_rx_frequency", rx), ("set_gpredict_tx_frequency", tx))
+
     def set_tx_selector(self, mode: str) -> None:
         logger.info("Selecting mode %s", mode)
         with self._lock:
             self._flowgraph.set_tx_selector(mode)
+            self._tx_selector = mode
 
     def get_tx_selector(self) -> str:
         with self._lock:
+            if self._tx_selector is not None:
+                return self._tx_selector
             val = self._flowgraph.get_tx_selector()
             if not isinstance(val, str):
                 raise TypeError("Flowgraph returned invalid tx_selector type")
+            self._tx_selector = val
             return val
 
     def set_tx_gain(self, gain: int) -> None:
@@ -95,10 +168,25 @@ class Radio:
         with self._lock:
             self._flowgraph.set_morse_ident(ident)
 
-    def edl(self, packet: bytes, range_velocity: float) -> None:
+    def edl(self, packet: bytes | memoryview, range_velocity: float) -> None:
+        self.edl_batch((packet,), range_velocity)
+
+    def edl_batch(self, packets: Iterable[bytes | memoryview], range_velocity: float) -> None:
+        '''Send EDL packets that share a doppler correction.
+
+        The TX frequency is set once for the whole batch instead of once per packet. Sends never
+        block the pass, if the socket buffer is full the packet is dropped.
+        '''
         self.set_tx_frequency(range_velocity)
-        self._edl.send(packet)
+        for packet in packets:
+            try:
+                self._edl.send(packet)
+            except BlockingIOError:
+                logger.warning("EDL send buffer full, dropping packet")
 
     def close(self) -> None:
-        # FIXME: close _flowgraph?
+        # The stock Transport already keeps its HTTP/1.1 connection around between calls, it's
+        # only reconnecting per call when the server answers HTTP/1.0 (GNU Radio's xmlrpc block
+        # does). Either way drop the cached connection here rather than leaking it.
+        self._flowgraph("close")()
         self._edl.close()
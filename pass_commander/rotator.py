@@ -23,9 +23,7 @@ logger = logging.getLogger(__name__)
 
 
 class RotatorError(Exception):
-    def __init__(self, arg: str) -> None:
-        '''Exceptions raised by Rotator.'''
-        super().__init__(arg)
+    '''Exceptions raised by Rotator.'''
 
 
 class Bound:
@@ -48,6 +46,20 @@ class Bound:
 
 
 class Rotator:
+    __slots__ = (
+        '_ppd',
+        '_r',
+        '_rot',
+        '_rotlock',
+        '_stop',
+        '_thread',
+        '_w',
+        'cal',
+        'cmd_interval',
+        'ppd',
+        'step',
+    )
+
     def __init__(self, path: Path, cal: AzEl = AzEl(0, 0), cmd_interval: float = 2.0) -> None:
         '''Monitor and point an antenna.
 
@@ -90,13 +102,13 @@ class Rotator:
     def listener(self) -> int:
         return self._r
 
-    def _events(self, pos: AzEl) -> None:
-        # Only runs from go to commanded position
-        self._stop = Event()
+    def _events(self, pos: AzEl, stop: Event) -> None:
+        # Only runs from go to commanded position. This thread only touches its own stop Event,
+        # _thread and _stop belong to the caller so there's no window where they're stale.
         last_reported = None
         # It turns out the rot2prog controller shouldn't be talked to more than once every 2
         # seconds otherwise it can potentially be knocked out of calibration by a degree or two.
-        while not self._stop.wait(timeout=self.cmd_interval):
+        while not stop.wait(timeout=self.cmd_interval):
             try:
                 with self._rotlock:
                     now = AzEl(*self._rot.status())
@@ -116,11 +128,9 @@ class Rotator:
             # - Serial communication failure
 
             if now.az in self._ppd.shift(pos.az) and now.el in self._ppd.shift(pos.el):
+                # Set before notifying so a listener can immediately start_polling() again
+                stop.set()
                 os.write(self._w, struct.pack("ff", now.az, now.el))
-                self._stop.set()
-
-        self._stop = None
-        self._thread = None
 
     def event(self) -> AzEl:
         return AzEl(*struct.unpack('ff', os.read(self.listener, 8)))
@@ -132,20 +142,29 @@ class Rotator:
 
     def go(self, pos: AzEl) -> None:
         az, el = pos
-        logger.info('%-18s%7.3f°az %7.3f°el', "Moving to", az, el)
+        # Called every nav step during a pass
+        logger.debug('%-18s%7.3f°az %7.3f°el', "Moving to", az, el)
         with self._rotlock:
             # FIXME: check result
             self._rot.set(az, el)
 
     def start_polling(self, pos: AzEl) -> None:
         if self._thread is not None:
-            raise RuntimeError("Already waiting for movement")
+            if self._stop is not None and not self._stop.is_set() and self._thread.is_alive():
+                raise RuntimeError("Already waiting for movement")
+            self._thread.join()
+        self._stop = Event()
         self._thread = Thread(
-            target=self._events, args=(pos,), name=f"Rotator-{pos.az:.1f}-{pos.el:.1f}"
+            target=self._events,
+            args=(pos, self._stop),
+            name=f"Rotator-{pos.az:.1f}-{pos.el:.1f}",
         )
         self._thread.start()
 
     def position(self) -> AzEl:
+        # One status() round trip is enough: unlike hamlib's rotctld, which reports the last
+        # requested position on the first read, the rot2prog controller always responds with where
+        # the antenna actually is. Don't add a priming read here.
         with self._rotlock:
             return AzEl(*self._rot.status())
 
@@ -170,3 +189,5 @@ class Rotator:
             self._thread.join()
         with self._rotlock:
             self._rot._ser.close()  # noqa: SLF001
+        os.close(self._r)
+        os.close(self._w)
@@ -1,5 +1,5 @@
 import logging
-import re
+from itertools import islice
 from pathlib import Path
 from time import time
 
@@ -10,6 +10,31 @@ from .config import TleCache
 
 logger = logging.getLogger(__name__)
 
+# Shared between Satellites so repeated lookups reuse the connection to CelesTrak
+_http = requests.Session()
+
+
+def _celestrak_query(sat_id: str) -> str:
+    '''Classify a satellite ID as one of the CelesTrak query types INTDES, CATNR, or NAME.'''
+    if not sat_id.isascii():
+        return "NAME"
+    # NORAD Catalog Number, up to 9 digits
+    if sat_id.isdecimal() and len(sat_id) <= 9:
+        return "CATNR"
+    # International Designator, YYYY[-]NNNP[P[P]]
+    year, launch = sat_id[:4], sat_id[4:].removeprefix('-')
+    number, piece = launch[:3], launch[3:]
+    if (
+        len(year) == 4
+        and year.isdecimal()
+        and len(number) == 3
+        and number.isdecimal()
+        and 1 <= len(piece) <= 3
+        and piece.isalpha()
+    ):
+        return "INTDES"
+    return "NAME"
+
 
 class Satellite(EarthSatellite):  # type: ignore[misc]
     def __init__(
@@ -46,11 +71,7 @@ class Satellite(EarthSatellite):  # type: ignore[misc]
         tle_cache
             A local cache of TLEs for lookup.
         '''
-        query = "NAME"
-        if re.match(r"^\d{4}-?\d{3}[A-Z]{1,3}$", sat_id.upper()):
-            query = "INTDES"
-        elif re.match(r"^\d{1,9}$", sat_id):
-            query = "CATNR"
+        query = _celestrak_query(sat_id)
         filename = conf_dir / f'{query}-{sat_id}.txt'
 
         # see https://celestrak.org/NORAD/documentation/gp-data-formats.php
@@ -60,7 +81,7 @@ class Satellite(EarthSatellite):  # type: ignore[misc]
         expired = not filename.exists() or (time() - filename.stat().st_mtime > 12 * 60 * 60)
         if not local_only and expired:
             logger.info("fetching TLE from celestrak for %s", sat_id)
-            r = requests.get(
+            r = _http.get(
                 "https://celestrak.org/NORAD/elements/gp.php",
                 params={query: sat_id},
                 timeout=10,
@@ -89,8 +110,8 @@ class Satellite(EarthSatellite):  # type: ignore[misc]
             if fname.is_file():
                 logger.info("using Gpredict's cached TLE")
                 with fname.open(encoding="ascii") as file:
-                    lines = file.readlines()[3:6]
-                    tle = [line.rstrip().split("=")[1] for line in lines]
+                    # Lines 3-5 are NICKNAME=, TLE1=, TLE2=, don't bother reading the rest
+                    tle = [line.partition("=")[2].rstrip() for line in islice(file, 3, 6)]
 
         if tle is None:
             logger.info("No matching TLE for %s is available", sat_id)
@@ -5,13 +5,49 @@ from time import sleep
 
 logger = logging.getLogger(__name__)
 
+# Seconds between LNA relay toggles
+DEFAULT_LNA_DELAY = 1.0
+
+# Every command stationd accepts
+_VERBS = frozenset(
+    [
+        "gettemp",
+        *(
+            f"{band} {dev} {state}"
+            for band in ("l-band", "uhf")
+            for dev in ("pa-power", "rf-ptt", "lna")
+            for state in ("on", "off", "status")
+        ),
+        *(f"rotator {state}" for state in ("on", "off", "status")),
+    ]
+)
+_WAIT = re.compile(r"Please wait (\S+) seconds")
+
 
 class StationError(Exception):
     pass
 
 
 class Station:
-    def __init__(self, addr: tuple[str, int], band: str = "l-band", lna_delay: float = 1.0) -> None:
+    __slots__ = (
+        '_lna_off',
+        '_lna_on',
+        '_pa_off',
+        '_pa_on',
+        '_ptt_off',
+        '_ptt_on',
+        'band',
+        'lna_delay',
+        's',
+    )
+
+    def __init__(
+        self,
+        addr: tuple[str, int],
+        band: str = "l-band",
+        lna_delay: float = DEFAULT_LNA_DELAY,
+        timeout: float = 2.0,
+    ) -> None:
         '''Python binding for uniclogs-stationd.
 
         Yes stationd is written in python but it only exposes a socket interface. Except also
@@ -27,25 +63,46 @@ class Station:
         lna_delay
             Time in seconds to wait after toggling the LNA relay. The lna_{on,off} methods toggle
             the relay three times so they'll take 3 * lna_delay seconds.
+        timeout
+            Time in seconds to wait for stationd to respond to a command.
         '''
-        self.s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        self.s.connect(addr)
+        self.s = self._connect(addr, timeout)
         self.band = band
         self.lna_delay = lna_delay
+        # Band doesn't change so build the commands once. They're still validated on send so an
+        # invalid band fails when used, not here.
+        self._pa_on = f"{band} pa-power on"
+        self._pa_off = f"{band} pa-power off"
+        self._ptt_on = f"{band} rf-ptt on"
+        self._ptt_off = f"{band} rf-ptt off"
+        self._lna_on = f"{band} lna on"
+        self._lna_off = f"{band} lna off"
+
+    @staticmethod
+    def _connect(addr: tuple[str, int], timeout: float | None) -> socket.socket:
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        s.settimeout(timeout)
+        s.connect(addr)
+        return s
 
     def _command(self, verb: str) -> str:
-        if re.match(
-            r"^(gettemp|((l-band|uhf) (pa-power|rf-ptt|lna)|rotator) (on|off|status))$",
-            verb,
-        ):
+        if verb in _VERBS:
             logger.info("Sending command: %s", verb)
             self.s.send(verb.encode())
             return self._response()
         raise StationError(f"invalid command: {verb}")
 
     def _response(self) -> str:
-        # FIXME: timeout, stationd should respond quickly
-        data = self.s.recv(4096)
+        # stationd should respond quickly, don't let a lost datagram wedge the pass
+        try:
+            data = self.s.recv(4096)
+        except TimeoutError as e:
+            # The reply may still turn up and would then be read as the response to the next
+            # command. A new socket gets a new port, so anything late to the old one is dropped.
+            old = self.s
+            self.s = self._connect(old.getpeername(), old.gettimeout())
+            old.close()
+            raise StationError("stationd timed out") from e
         stat = data.decode().strip()
         logger.info("StationD response: %s", stat)
         if stat.upper().startswith("FAIL: "):
@@ -53,22 +110,33 @@ class Station:
         return stat
 
     def pa_on(self) -> None:
-        self._command(f"{self.band} pa-power on")
-        self._command(f"{self.band} pa-power on")
+        self._command(self._pa_on)
+        self._command(self._pa_on)
+
+    def pa_off(self, retries: int = 3) -> None:
+        '''Turn off the PA, waiting out any cooldown stationd asks for.
 
-    def pa_off(self) -> None:
-        ret = self._command(f"{self.band} pa-power off")
-        if m := re.search(r"Please wait (\S+) seconds", ret):
-            sleep(int(m.group(1)))
-            self.pa_off()
+        Parameters
+        ----------
+        retries
+            Number of times to retry after stationd responds with "Please wait N seconds".
+        '''
+        for attempt in range(retries + 1):
+            ret = self._command(self._pa_off)
+            m = _WAIT.search(ret)
+            if m is None:
+                return
+            if attempt < retries:
+                sleep(int(m.group(1)))
+        raise StationError(f"PA power off still pending: {ret}")
 
     def ptt_on(self) -> None:
-        self._command(f"{self.band} rf-ptt on")
+        self._command(self._ptt_on)
         # FIXME TIMING: wait for PTT to open (100ms is just a guess)
         sleep(0.1)
 
     def ptt_off(self) -> None:
-        self._command(f"{self.band} rf-ptt off")
+        self._command(self._ptt_off)
 
     def lna_on(self) -> None:
         # The LNA Relay is weird, it's not guaranteed to go on on the first try
@@ -77,19 +145,19 @@ class Station:
         # state, I am unsure of how fast the relay can go through multiple
         # state changes. I would suggest as large as one second between
         # commands just to be safe.
-        self._command(f"{self.band} lna on")
+        self._command(self._lna_on)
         sleep(self.lna_delay)
-        self._command(f"{self.band} lna off")
+        self._command(self._lna_off)
         sleep(self.lna_delay)
-        self._command(f"{self.band} lna on")
+        self._command(self._lna_on)
         sleep(self.lna_delay)
 
     def lna_off(self) -> None:
-        self._command(f"{self.band} lna off")
+        self._command(self._lna_off)
         sleep(self.lna_delay)
-        self._command(f"{self.band} lna on")
+        self._command(self._lna_on)
         sleep(self.lna_delay)
-        self._command(f"{self.band} lna off")
+        self._command(self._lna_off)
         sleep(self.lna_delay)
 
     def gettemp(self) -> float:
@@ -4,10 +4,13 @@ import logging
 from copy import deepcopy
 from dataclasses import dataclass
 from datetime import timedelta
+from time import monotonic
 from typing import TYPE_CHECKING, NamedTuple
 
+import numpy as np
 import requests
 from skyfield.api import Time, load
+from skyfield.nutationlib import iau2000b_radians
 from skyfield.units import Angle, Velocity
 
 if TYPE_CHECKING:
@@ -17,6 +20,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Seconds to reuse a weather response before fetching a new one
+WEATHER_TTL = 10 * 60
+
 
 class PassEvent(NamedTuple):
     time: Time
@@ -36,6 +42,8 @@ class PassInfo:
 
 
 class Tracker:
+    __slots__ = ('_http', '_weather', '_weather_params', 'obs', 'owmid', 'ts')
+
     def __init__(
         self,
         observer: GeographicPosition,
@@ -57,14 +65,31 @@ class Tracker:
         self.owmid = owmid
         self.obs = observer
         self.ts = load.timescale()
+        # (monotonic fetch time, (temp, pressure)) of the last weather response
+        self._weather: tuple[float, tuple[float, float]] | None = None
+        # Keeps the TLS connection to OpenWeatherMap alive between fetches
+        self._http = requests.Session()
+        # The observer doesn't move, format its query parameters once
+        self._weather_params = {
+            'lat': f'{observer.latitude.degrees:.3f}',
+            'lon': f'{observer.longitude.degrees:.3f}',
+            'exclude': 'minutely,hourly,daily,alerts',
+            'units': 'metric',
+        }
 
     def _build_passinfo(self, sat: Satellite, times: list[Time]) -> PassInfo:
-        events = []
-        for t in times:
-            # Not compensating for temperature/pressure because the culm could be well in the future
-            # Recomputed later accounting for them in track()
-            el, az, _ = (sat - self.obs).at(t).altaz()
-            events.append(PassEvent(t, az, el))
+        # Evaluate every event in one array so precession/nutation and the observer position are
+        # computed once per pass instead of once per event.
+        t = self.ts.tt_jd(
+            np.array([x.whole for x in times]), np.array([x.tt_fraction for x in times])
+        )
+        # Not compensating for temperature/pressure because the culm could be well in the future
+        # Recomputed later accounting for them in track()
+        el, az, _ = (sat - self.obs).at(t).altaz()
+        events = [
+            PassEvent(x, Angle(radians=a), Angle(radians=e))
+            for x, a, e in zip(times, az.radians, el.radians, strict=True)
+        ]
         return PassInfo(events[0], events[1:-1], events[-1])
 
     # FIXME: filtering by time of day
@@ -145,37 +170,48 @@ class Tracker:
             # From the ephem docs, temperature defaults to 25 C, pressure defaults to 1010 mBar
             logger.info("not fetching weather for calibration")
             return (25.0, 1010.0)
+        # Weather doesn't change on the scale of a pass, and reusing it keeps us well under the
+        # rate limit of 1 per minute/1000 per day.
+        if self._weather is not None and monotonic() - self._weather[0] < WEATHER_TTL:
+            logger.debug("Using cached weather")
+            return self._weather[1]
         # See https://openweathermap.org/api/one-call-3
-        # FIXME: Rate limit 1 per mintue/1000 per day
-        r = requests.get(
+        r = self._http.get(
             'https://api.openweathermap.org/data/3.0/onecall',
-            params={
-                'lat': f'{self.obs.latitude.degrees:.3f}',
-                'lon': f'{self.obs.longitude.degrees:.3f}',
-                'exclude': 'minutely,hourly,daily,alerts',
-                'units': 'metric',
-                'appid': self.owmid,
-            },
+            params={**self._weather_params, 'appid': self.owmid},
             timeout=10,
         )
         r.raise_for_status()
         logger.debug("Weather response: %s", r.json())
         c = r.json()["current"]
-        return (c['temp'], c['pressure'])
+        self._weather = (monotonic(), (c['temp'], c['pressure']))
+        return self._weather[1]
 
     def track(
-        self, sat: Satellite, singlepass: PassInfo, temp: float = 25.0, pressure: float = 1010.0
+        self,
+        sat: Satellite,
+        singlepass: PassInfo,
+        temp: float = 25.0,
+        pressure: float = 1010.0,
+        *,
+        use_iau2000b: bool = True,
     ) -> tuple[tuple[Time, Angle, Angle], tuple[Time, Velocity]]:
         """Create a track of a given satellite relative to the set observer.
 
         Note that as the satellite is approaching the observer the rangevel is negative, and as it's
         moving away the value is positive.
+
+        By default nutation uses the truncated IAU2000B model instead of the full IAU2000A, which
+        is many times faster to compute over a whole pass and only moves the observer by a few
+        millimeters, far below what TLE accuracy or the rotator can resolve.
         """
         rise = singlepass.rise.time
         fall = singlepass.fall.time
 
         pass_duration_seconds = (fall - rise) * 24 * 60 * 60
         passtimes = self.ts.linspace(rise, fall, int(pass_duration_seconds / 2))
+        if use_iau2000b:
+            passtimes._nutation_angles_radians = iau2000b_radians(passtimes)  # noqa: SLF001
         positions = (sat - self.obs).at(passtimes)
 
         el, az, _ = positions.altaz(temperature_C=temp, pressure_mbar=pressure)
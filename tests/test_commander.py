@@ -1,10 +1,28 @@
 # ruff: noqa: ERA001
 
+import ctypes
+import os
+import select
+import socket
+from collections.abc import Iterable
+from pathlib import Path
+from threading import Timer
+from time import monotonic, time
+
+import linuxfd
 import pytest
 from skyfield.api import E, N, Time, wgs84
 from skyfield.units import Angle, Velocity
 
-from pass_commander.commander import Commander, SinglePass
+from pass_commander.commander import (
+    _SO_BUSY_POLL,
+    Commander,
+    SinglePass,
+    Sleeper,
+    _adjtimex_synchronized,
+    _realtime,
+    _Timex,
+)
 from pass_commander.config import Config
 from pass_commander.mock.flowgraph import Edl, Flowgraph
 from pass_commander.mock.rotator import PtyRotator
@@ -29,6 +47,29 @@ def mock_config(
     return good_config
 
 
+class TestSleeper:
+    def test_sleep(self) -> None:
+        sleeper = Sleeper()
+        start = monotonic()
+        assert sleeper.sleep(0.05)
+        assert monotonic() - start >= 0.05
+        assert sleeper.sleep(0)
+        sleeper.close()
+
+    def test_cancel(self) -> None:
+        sleeper = Sleeper()
+        Timer(0.05, sleeper.cancel).start()
+        start = monotonic()
+        assert not sleeper.sleep(60)
+        assert monotonic() - start < 30
+
+        # Cancel while not sleeping wakes the next sleep, once
+        sleeper.cancel()
+        assert not sleeper.sleep(60)
+        assert sleeper.sleep(0)
+        sleeper.close()
+
+
 class TestSinglePass:
     def test_work_pass(self, mock_config: Config, sat: Satellite) -> None:
         sp = SinglePass(mock_config, lna_delay=0.0, morse_delay=0.0, cooloff_delay=0.0)
@@ -63,8 +104,123 @@ class TestSinglePass:
         with pytest.raises(RuntimeError, match=r"^Temperature too high"):
             sp.work((pt, az, el), (pt, az, el), (rt, rv))
 
+    def test_lazy_hardware(self, mock_config: Config) -> None:
+        hardware = {'sta', 'uhf', 'rot', 'rad'}
+        sp = SinglePass(mock_config, lna_delay=0.0, morse_delay=0.0, cooloff_delay=0.0)
+        assert not hardware & vars(sp).keys()
+
+        rot = sp.rot
+        assert sp.rot is rot
+        sp.release_hardware()
+        assert not hardware & vars(sp).keys()
+        assert sp.rot is not rot
+        sp.release_hardware()
+
+        # Safing after a pass that never connected anything doesn't connect anything either
+        sp.edl = None
+        sp.reset_hardware()
+        assert not hardware & vars(sp).keys()
+
+    def test_edl_drain(self, mock_config: Config) -> None:
+        sp = SinglePass(mock_config, lna_delay=0.0, morse_delay=0.0, cooloff_delay=0.0)
+        sp.current_rv = 0.0
+        sent: list[list[bytes]] = []
+
+        class FakeRadio:
+            def edl_batch(self, packets: Iterable[bytes | memoryview], _rv: float) -> None:
+                # Packets share a receive buffer so they have to be copied out as they're consumed
+                sent.append([bytes(p) for p in packets])
+
+        # Stand in for the cached property so no real Radio gets connected
+        sp.__dict__['rad'] = FakeRadio()
+
+        with (
+            socket.socket(socket.AF_INET, socket.SOCK_DGRAM | socket.SOCK_NONBLOCK) as rx,
+            socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as tx,
+        ):
+            rx.bind(('127.0.0.1', 0))
+            packets = [f"packet {i}".encode('ascii') for i in range(3)]
+            for packet in packets:
+                tx.sendto(packet, rx.getsockname())
+            sp.edl = rx
+            assert sp.on_edl(select.EPOLLIN)
+            # Spurious wakeup with nothing queued sends nothing
+            assert sp.on_edl(select.EPOLLIN)
+        assert sent == [packets]
+
+    def test_advance(self) -> None:
+        timer = linuxfd.timerfd(rtc=True, nonBlocking=True)
+        # Started 25s ago with a 10s period, 3 periods have elapsed
+        timer.settime(time() - 25, 10, absolute=True)
+        assert SinglePass._advance(timer, 0, 10, 'test') == 3  # noqa: SLF001
+
+        timer.settime(time() - 25, 10, absolute=True)
+        with pytest.raises(StopIteration):
+            SinglePass._advance(timer, 0, 3, 'test')  # noqa: SLF001
+
+    def test_busy_poll(self, caplog: pytest.LogCaptureFixture) -> None:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            # Either succeeds or warns, depending on privileges
+            SinglePass._busy_poll(sock)  # noqa: SLF001
+            if "Not permitted to busy poll" not in caplog.text:
+                assert sock.getsockopt(socket.SOL_SOCKET, _SO_BUSY_POLL) == 50
+
+    def test_busy_poll_denied(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        def denied(*_args: object) -> None:
+            raise PermissionError
+
+        monkeypatch.setattr(socket.socket, 'setsockopt', denied)
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            SinglePass._busy_poll(sock)  # noqa: SLF001
+        assert "Not permitted to busy poll" in caplog.text
+
+    def test_realtime(self) -> None:
+        policy = os.sched_getscheduler(0)
+        # Either succeeds or warns, depending on privileges, but always restores
+        with _realtime():
+            pass
+        assert os.sched_getscheduler(0) == policy
+
+    def test_realtime_denied(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        def denied(*_args: object) -> None:
+            raise PermissionError
+
+        ran: list[bool] = []
+
+        def work() -> None:
+            with _realtime():
+                ran.append(True)
+                raise ValueError("in pass")
+
+        monkeypatch.setattr(os, 'sched_setscheduler', denied)
+        with pytest.raises(ValueError, match="in pass") as exc:
+            work()
+        assert ran
+        assert "Not permitted to use realtime scheduling" in caplog.text
+        # Errors from the pass must not be reported as happening while handling PermissionError
+        assert exc.value.__context__ is None
+
 
 class TestCommander:
+    def test_adjtimex(self) -> None:
+        if ctypes.sizeof(ctypes.c_long) == 8:
+            # sizeof(struct timex) on LP64 glibc
+            assert ctypes.sizeof(_Timex) == 208
+        # Whether or not this machine is synchronized, adjtimex itself should work
+        assert _adjtimex_synchronized() is not None
+
+    def test_cancel(self, good_config: Config) -> None:
+        before = set(Path('/proc/self/fd').iterdir())
+        cmdr = Commander(good_config)
+        Timer(0.05, cmdr.cancel).start()
+        assert not cmdr.sleeper.sleep(60)
+        cmdr.close()
+        assert set(Path('/proc/self/fd').iterdir()) <= before
+
     def test_pointing_mode(self, mock_config: Config) -> None:
         class FakePass:
             def work(
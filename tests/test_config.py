@@ -1,5 +1,6 @@
 import dataclasses
 import typing
+from ipaddress import IPv4Address
 from pathlib import Path
 from socket import gethostbyname
 
@@ -104,6 +105,31 @@ class TestConfig:
         with pytest.raises(config.IpValidationError):
             Config(path)
 
+    def test_resolve(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        lookups = []
+
+        def fake_gethostbyname(host: str) -> str:
+            lookups.append(host)
+            return '10.0.0.1'
+
+        monkeypatch.setattr(config, 'gethostbyname', fake_gethostbyname)
+        config._resolve.cache_clear()  # noqa: SLF001
+        # IP addresses skip DNS, hostnames are only looked up once
+        assert config._resolve('127.0.0.2') == IPv4Address('127.0.0.2')  # noqa: SLF001
+        assert config._resolve('station') == IPv4Address('10.0.0.1')  # noqa: SLF001
+        assert config._resolve('station') == IPv4Address('10.0.0.1')  # noqa: SLF001
+        assert lookups == ['station']
+        config._resolve.cache_clear()  # noqa: SLF001
+
+    def test_pop_ips_literal(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def no_pool(*_args: object, **_kwargs: object) -> None:
+            raise AssertionError("IP addresses don't need a thread pool")
+
+        monkeypatch.setattr(config, 'ThreadPoolExecutor', no_pool)
+        table = config._Table('Hosts', {'radio': '127.0.0.2', 'station': '127.0.0.3'})  # noqa: SLF001
+        ips = config._pop_ips(table, 'radio', 'station')  # noqa: SLF001
+        assert ips == [IPv4Address('127.0.0.2'), IPv4Address('127.0.0.3')]
+
     def test_integer_lat_lon(self, tmp_path: Path, good_toml: TOMLDocument) -> None:
         good_toml['Observer']['lat'] = 45
         good_toml['Observer']['lon'] = -122
@@ -154,7 +180,7 @@ class TestConfig:
             Config(path)
         assert isinstance(e.value.__cause__, ValueError)
 
-    @pytest.mark.parametrize('edlport', ["12345", 1.2345])
+    @pytest.mark.parametrize('edlport', ["12345", 1.2345, True])
     def test_edl(self, tmp_path: Path, good_toml: TOMLDocument, edlport: str | float) -> None:
         good_toml['Main']['edl_port'] = edlport
         path = tmp_path / "edlport.toml"
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 from skyfield.api import load
 from skyfield.units import Angle
 
@@ -11,6 +12,21 @@ from pass_commander.tracker import PassEvent, PassInfo
 class TestNavigator:
     ts = load.timescale()
 
+    @pytest.mark.parametrize(
+        ('a', 'b', 'c', 'expected'),
+        [
+            (1, 2, 3, True),
+            (3, 2, 1, True),
+            (1, 3, 2, False),
+            (3, 1, 2, False),
+            (1, 1, 2, False),
+            (1, 2, 2, False),
+            (1, 1, 1, False),
+        ],
+    )
+    def test_no_zero_cross(self, a: float, b: float, c: float, expected: bool) -> None:  # noqa: FBT001
+        assert Navigator.no_zero_cross(a, b, c) is expected
+
     def test_nav_straight(self) -> None:
         info = PassInfo(
             PassEvent(self.ts.now(), Angle(degrees=45), Angle(degrees=0)),
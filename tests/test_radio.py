@@ -1,6 +1,7 @@
 from contextlib import closing
 from itertools import pairwise
 
+import numpy as np
 import pytest
 from skyfield.api import E, N, wgs84
 
@@ -40,15 +41,90 @@ class TestRadio:
         assert tx[0] < radio.txfreq < tx[-1]
         assert all(x < y for x, y in pairwise(tx))
 
+    def test_doppler_vectorized(self, radio: Radio) -> None:
+        rangevel = np.linspace(-7000.0, 7000.0, 11)
+        rx = radio.rx_frequency(rangevel)
+        tx = radio.tx_frequency(rangevel)
+        assert rx.shape == tx.shape == rangevel.shape
+        for v, r, t in zip(rangevel, rx, tx, strict=True):
+            assert r == pytest.approx(radio.rx_frequency(float(v)))
+            assert t == pytest.approx(radio.tx_frequency(float(v)))
+
+    @pytest.mark.parametrize('multicall', [True, False])
+    def test_set_frequencies(self, edl: Edl, multicall: bool) -> None:  # noqa: FBT001
+        flowgraph = Flowgraph(multicall=multicall)
+        flowgraph.start()
+        # object so the bound append is acceptable as an xmlrpc handler
+        rx: list[object] = []
+        tx: list[object] = []
+        flowgraph._server.register_function(rx.append, "set_gpredict_rx_frequency")  # noqa: SLF001
+        flowgraph._server.register_function(tx.append, "set_gpredict_tx_frequency")  # noqa: SLF001
+        trips = 0
+        handle = flowgraph._server.handle_request  # noqa: SLF001
+
+        def counting() -> None:
+            nonlocal trips
+            trips += 1
+            handle()
+
+        try:
+            with closing(Radio(flowgraph.addr, edl.addr, "TEST")) as radio:
+                assert radio._multicall is multicall  # noqa: SLF001
+                trips = 0
+                flowgraph._server.handle_request = counting  # type: ignore[method-assign]  # noqa: SLF001
+                radio.set_frequencies(radio.rx_frequency(1000.0), radio.tx_frequency(1000.0))
+                radio.set_frequencies(radio.rx_frequency(1000.0), radio.tx_frequency(1000.0))
+        finally:
+            flowgraph.close()
+            flowgraph._thread.join()  # noqa: SLF001
+
+        # One round trip per tick either way, TX only follows when it can share it with RX
+        assert trips == 2
+        assert rx == [radio.rx_frequency(1000.0)] * 2
+        assert tx == ([radio.tx_frequency(1000.0)] * 2 if multicall else [])
+
     def test_ident(self, radio: Radio) -> None:
         radio.morse_delay = 0
         radio.ident()
 
+    @pytest.mark.parametrize('multicall', [True, False])
+    def test_ident_calls(self, flowgraph: Flowgraph, edl: Edl, multicall: bool) -> None:  # noqa: FBT001
+        selector: list[object] = []
+        ident: list[object] = []
+        flowgraph._server.register_function(selector.append, "set_tx_selector")  # noqa: SLF001
+        flowgraph._server.register_function(ident.append, "set_morse_ident")  # noqa: SLF001
+
+        with closing(Radio(flowgraph.addr, edl.addr, "TEST", morse_delay=0)) as radio:
+            radio._multicall = multicall  # noqa: SLF001
+            radio.set_tx_selector('edl')
+            radio.ident()
+            assert radio.get_tx_selector() == 'edl'
+
+        assert selector == ['edl', 'morse', 'edl']
+        assert ident == ['TEST']
+
     def test_selector(self, radio: Radio) -> None:
         mode = 'cw'
         radio.set_tx_selector(mode)
         assert radio.get_tx_selector() == mode
 
+    def test_selector_cached(self, radio: Radio, flowgraph: Flowgraph) -> None:
+        gets = 0
+
+        def get_tx_selector() -> str:
+            nonlocal gets
+            gets += 1
+            return 'edl'
+
+        flowgraph._server.register_function(get_tx_selector)  # noqa: SLF001
+        assert radio.get_tx_selector() == 'edl'
+        assert radio.get_tx_selector() == 'edl'
+        assert gets == 1
+
+        radio.set_tx_selector('morse')
+        assert radio.get_tx_selector() == 'morse'
+        assert gets == 1
+
     def test_tx_gain(self, radio: Radio) -> None:
         gain = 55
         radio.set_tx_gain(gain)
@@ -62,3 +138,7 @@ class TestRadio:
     def test_edl(self, radio: Radio) -> None:
         packet = "test string".encode('ascii')
         radio.edl(packet, 0)
+
+    def test_edl_batch(self, radio: Radio) -> None:
+        packets = [f"test string {i}".encode('ascii') for i in range(3)]
+        radio.edl_batch(packets, 0)
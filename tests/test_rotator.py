@@ -1,6 +1,7 @@
 import selectors
 from contextlib import closing
 from math import isclose
+from pathlib import Path
 
 import pytest
 
@@ -57,3 +58,10 @@ class TestRotator:
         for azel in bad:
             with pytest.raises(ValueError, match="out of range"):
                 rot.go(azel)
+
+    def test_close_fds(self, rotator: PtyRotator) -> None:
+        # A Rotator is opened and closed every pass, none of its fds may outlive it
+        before = set(Path("/proc/self/fd").iterdir())
+        for _ in range(3):
+            Rotator(rotator, cmd_interval=0).close()
+        assert set(Path("/proc/self/fd").iterdir()) <= before
@@ -5,7 +5,7 @@ import pytest
 import requests
 import responses
 
-from pass_commander.satellite import Satellite
+from pass_commander.satellite import Satellite, _celestrak_query
 
 
 class TestSatellite:
@@ -32,6 +32,23 @@ class TestSatellite:
         'ORESAT0.5',
     ]
 
+    @pytest.mark.parametrize(
+        ('sat_id', 'query'),
+        [
+            ('2024-149BK', 'INTDES'),
+            ('2024149bk', 'INTDES'),
+            ('2024-149BKAB', 'NAME'),
+            ('2024-149', 'NAME'),
+            ('60525', 'CATNR'),
+            ('123456789', 'CATNR'),
+            ('1234567890', 'NAME'),
+            ('ORESAT0.5', 'NAME'),
+            ('', 'NAME'),
+        ],
+    )
+    def test_query(self, sat_id: str, query: str) -> None:
+        assert _celestrak_query(sat_id) == query
+
     @responses.activate
     def test_cache(self, tmp_path: Path) -> None:
         cache = dict.fromkeys(self.names, self.tle)
@@ -86,3 +103,22 @@ class TestSatellite:
         responses.add(fallback)
 
         Satellite('fallback', tmp_path, tle_cache={'fallback': self.tle})
+
+    def test_gpredict(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv('HOME', str(tmp_path))
+        gpredict = tmp_path / '.config/Gpredict'
+        gpredict.mkdir(parents=True)
+        (gpredict / f'satdata{self.names[1]}.sat').write_text(
+            '[Satellite]\n'
+            'VERSION=1.1\n'
+            f'NAME={self.tle[0]}\n'
+            f'NICKNAME={self.tle[0]}\n'
+            f'TLE1={self.tle[1]}\n'
+            f'TLE2={self.tle[2]}\n'
+            'STATUS=0\n',
+            encoding='ascii',
+        )
+
+        sat = Satellite(self.names[1], tmp_path, local_only=True)
+        assert sat.name == self.tle[0]
+        assert sat.model.satnum == int(self.names[1])
@@ -1,3 +1,4 @@
+import socket
 from contextlib import closing
 
 import pytest
@@ -11,6 +12,17 @@ class TestStation:
             s.pa_on()
             s.pa_off()
 
+    def test_pa_off_wait(self, stationd: tuple[str, int], monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr('pass_commander.station.sleep', lambda _: None)
+        with closing(Station(stationd)) as s:
+            responses = iter(['Please wait 1 seconds', 'Please wait 1 seconds', 'OK'])
+            monkeypatch.setattr(Station, '_command', lambda _self, _verb: next(responses))
+            s.pa_off()
+
+            monkeypatch.setattr(Station, '_command', lambda _self, _verb: 'Please wait 1 seconds')
+            with pytest.raises(StationError, match='still pending'):
+                s.pa_off(retries=2)
+
     def test_ptt(self, stationd: tuple[str, int]) -> None:
         with closing(Station(stationd)) as s:
             s.ptt_on()
@@ -44,3 +56,29 @@ class TestStation:
             pytest.raises(StationError, match='invalid command'),
         ):
             s.pa_on()
+
+    def test_timeout(self) -> None:
+        # Bound but never responds
+        with closing(socket.socket(socket.AF_INET, socket.SOCK_DGRAM)) as silent:
+            silent.bind(('127.0.0.1', 0))
+            with (
+                closing(Station(silent.getsockname(), timeout=0.01)) as s,
+                pytest.raises(StationError, match='timed out'),
+            ):
+                s.gettemp()
+
+    def test_late_response(self) -> None:
+        with closing(socket.socket(socket.AF_INET, socket.SOCK_DGRAM)) as slow:
+            slow.bind(('127.0.0.1', 0))
+            with closing(Station(slow.getsockname(), timeout=0.01)) as s:
+                with pytest.raises(StationError, match='timed out'):
+                    s.gettemp()
+                # The reply to the timed out command arrives after all
+                _, client = slow.recvfrom(4096)
+                slow.sendto(b"temp: 1.0", client)
+
+                s.s.send(b"gettemp")
+                _, client = slow.recvfrom(4096)
+                slow.sendto(b"temp: 2.0", client)
+                # Not off by one from the late reply
+                assert s._response() == "temp: 2.0"  # noqa: SLF001
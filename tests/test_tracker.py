@@ -1,5 +1,6 @@
 from datetime import timedelta
 
+import pytest
 import responses
 from skyfield.api import E, N, wgs84
 
@@ -15,6 +16,17 @@ class TestTracker:
         if np.fall.time - np.rise.time < (timedelta(hours=1) / timedelta(days=1)):
             track.track(sat, np)
 
+    def test_track_iau2000b(self, sat: Satellite) -> None:
+        track = Tracker(wgs84.latlon(45.509054 * N, -122.681394 * E, 50))
+        np = track.next_pass(sat, after=sat.epoch)
+        assert np is not None
+        (_, az_b, el_b), (_, rv_b) = track.track(sat, np)
+        (_, az_a, el_a), (_, rv_a) = track.track(sat, np, use_iau2000b=False)
+        # Truncated nutation should be indistinguishable at rotator and doppler resolution
+        assert az_b.degrees == pytest.approx(az_a.degrees, abs=1e-3)
+        assert el_b.degrees == pytest.approx(el_a.degrees, abs=1e-3)
+        assert rv_b.m_per_s == pytest.approx(rv_a.m_per_s, abs=1e-2)
+
     @responses.activate
     def test_weather(self) -> None:
         lat = 45.509054
@@ -39,3 +51,6 @@ class TestTracker:
                 body=f'{{"current": {{"temp": {weather[0]}, "pressure": {weather[1]}}}}}',
             )
             assert track.weather() == weather
+            # Cached, should not make a second request
+            assert track.weather() == weather
+            assert len(rsps.calls) == 1